@@ -1,43 +1,50 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, request, jsonify
 import openai
-from langchain_openai import OpenAI
 from dotenv import load_dotenv
 import os
+from llm_transport import create_transport
+from static_assets import init_assets, render_page
 
 app = Flask(__name__)
 
+# Fingerprinted, pre-compressed CSS/JS bundles (see static_assets.py)
+init_assets(app)
+
 # Load environment variables
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
+# Live, record or replay transport for model calls (see llm_transport.py)
+llm = create_transport()
+
 @app.route('/')
 def home():
-    return render_template('home_improved.html')
+    return render_page('home_improved.html')
 
 @app.route('/toefl')
 def toefl():
-    return render_template('toefl.html')
+    return render_page('toefl.html')
 
 @app.route('/gre')
 def gre():
-    return render_template('gre.html')
+    return render_page('gre.html')
 
 @app.route('/ielts')
 def ielts():
-    return render_template('ielts.html')
+    return render_page('ielts.html')
 
 # Improved versions
 @app.route('/toefl_improved')
 def toefl_improved():
-    return render_template('toefl_improved.html')
+    return render_page('toefl_improved.html')
 
 @app.route('/gre_improved')
 def gre_improved():
-    return render_template('gre_improved.html')
+    return render_page('gre_improved.html')
 
 @app.route('/ielts_improved')
 def ielts_improved():
-    return render_template('ielts_improved.html')
+    return render_page('ielts_improved.html')
 
 @app.route('/generate_sample', methods=['POST'])
 def generate_sample():
@@ -64,7 +71,6 @@ def generate_sample():
     Generate an essay that would receive a full score (5/5) from TOEFL raters.
     """
 
-    llm = OpenAI(model="gpt-4o-mini")
     response = llm.invoke(detailed_prompt)
 
     # Clean and format the response
@@ -229,7 +235,6 @@ def score_essay():
     Format your response clearly with section headers.
     """
 
-    llm = OpenAI(model="gpt-4o-mini")
     scoring_response = llm.invoke(scoring_prompt)
     
     # Format the scoring response
@@ -533,7 +538,6 @@ def analyze_writing():
     Return ONLY the JSON object with comprehensive analysis. Ensure all fields are properly filled with relevant, specific feedback. No additional text, markdown, or explanations outside the JSON structure.
     """
 
-    llm = OpenAI(model="gpt-4o-mini")
     response = llm.invoke(analysis_prompt)
     
     try:
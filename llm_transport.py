@@ -0,0 +1,158 @@
+"""Pluggable transport for LLM calls.
+
+Every route talks to the model through a transport exposing ``invoke(prompt)``.
+The transport is chosen with the ``LLM_TRANSPORT`` environment variable:
+
+- ``live`` (default): call the OpenAI model through LangChain.
+- ``record``: call the live model and append each prompt/completion pair to
+  the cassette file given by ``LLM_CASSETTE``.
+- ``replay``: serve completions from the cassette, optionally sleeping
+  ``LLM_REPLAY_LATENCY`` seconds per call to simulate the model. Unknown
+  prompts fall through to the live model unless ``LLM_REPLAY_STRICT`` is set,
+  in which case they raise ``CassetteMissError``.
+
+Cassettes are JSON Lines files (gzip-compressed when the name ends in ``.gz``).
+Each line holds one entry keyed by a SHA-256 of the model name and prompt, and
+the file is indexed into a dict on load so lookups are constant time.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_CASSETTE = "llm_cassette.jsonl"
+
+
+class CassetteMissError(LookupError):
+    """Raised in strict replay mode when a prompt is not in the cassette"""
+
+
+def prompt_key(model, prompt):
+    """Return the cassette key for a model/prompt pair"""
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _open_cassette(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """Indexed store of recorded prompt -> completion pairs"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self.load()
+
+    def load(self):
+        with _open_cassette(self.path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    self.entries[entry["key"]] = entry["completion"]
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def add(self, key, model, prompt, completion):
+        entry = {"key": key, "model": model, "prompt": prompt, "completion": completion}
+        with self._lock:
+            if self.entries.get(key) == completion:
+                return
+            self.entries[key] = completion
+            # Append-only so a crash mid-run never loses earlier recordings;
+            # on load the last entry for a key wins.
+            with _open_cassette(self.path, "a") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LiveTransport:
+    """Call the OpenAI model through LangChain"""
+
+    def __init__(self, model=DEFAULT_MODEL):
+        self.model = model
+        self._llm = None
+
+    def invoke(self, prompt):
+        if self._llm is None:
+            # Imported lazily so replay runs do not need the client installed
+            from langchain_openai import OpenAI
+            self._llm = OpenAI(model=self.model)
+        return self._llm.invoke(prompt)
+
+
+class RecordingTransport:
+    """Call the live model and record every completion to a cassette"""
+
+    def __init__(self, cassette, live=None):
+        self.cassette = cassette
+        self.live = live or LiveTransport()
+        self.model = self.live.model
+
+    def invoke(self, prompt):
+        completion = self.live.invoke(prompt)
+        self.cassette.add(prompt_key(self.model, prompt), self.model, prompt, completion)
+        return completion
+
+
+class ReplayTransport:
+    """Serve completions from a cassette instead of the network"""
+
+    def __init__(self, cassette, latency=0.0, strict=False, live=None, model=DEFAULT_MODEL):
+        self.cassette = cassette
+        self.latency = latency
+        self.strict = strict
+        self.live = live
+        self.model = live.model if live else model
+
+    def invoke(self, prompt):
+        completion = self.cassette.get(prompt_key(self.model, prompt))
+        if completion is None:
+            if self.strict:
+                preview = " ".join(prompt.split())[:80]
+                raise CassetteMissError(f"No recorded completion for prompt: {preview!r}")
+            if self.live is None:
+                self.live = LiveTransport(self.model)
+            return self.live.invoke(prompt)
+        if self.latency:
+            time.sleep(self.latency)
+        return completion
+
+
+def _env_flag(name):
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def create_transport(mode=None, cassette_path=None, latency=None, strict=None, model=DEFAULT_MODEL):
+    """Build a transport from arguments, falling back to environment variables"""
+    mode = (mode or os.getenv("LLM_TRANSPORT") or "live").strip().lower()
+    cassette_path = cassette_path or os.getenv("LLM_CASSETTE") or DEFAULT_CASSETTE
+    if latency is None:
+        latency = float(os.getenv("LLM_REPLAY_LATENCY") or 0)
+    if strict is None:
+        strict = _env_flag("LLM_REPLAY_STRICT")
+
+    if mode == "live":
+        return LiveTransport(model)
+    if mode == "record":
+        return RecordingTransport(Cassette(cassette_path), LiveTransport(model))
+    if mode == "replay":
+        if not os.path.exists(cassette_path):
+            raise FileNotFoundError(f"Cassette not found: {cassette_path}")
+        return ReplayTransport(Cassette(cassette_path), latency=latency, strict=strict, model=model)
+    raise ValueError(f"Unknown LLM_TRANSPORT mode: {mode!r} (expected live, record or replay)")
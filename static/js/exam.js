@@ -0,0 +1,917 @@
+let currentEssay = '';
+let currentPrompt = '';
+let timerInterval = null;
+let timeLeft = 30 * 60; // 30 minutes in seconds
+let isRunning = false;
+
+// Timer functions
+function updateTimerDisplay() {
+  const minutes = Math.floor(timeLeft / 60);
+  const seconds = timeLeft % 60;
+  const display = `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+  document.getElementById('timer-display').textContent = display;
+
+  // Flash warning when 5 minutes left
+  if (timeLeft <= 5 * 60 && timeLeft > 0) {
+    document.getElementById('timer-warning').classList.remove('hidden');
+    if (timeLeft <= 5 * 60 && timeLeft % 2 === 0) {
+      document.getElementById('timer-display').classList.add('text-red-600');
+      document.getElementById('timer-display').style.animation = 'blink 1s infinite';
+    }
+  } else {
+    document.getElementById('timer-warning').classList.add('hidden');
+    document.getElementById('timer-display').classList.remove('text-red-600');
+    document.getElementById('timer-display').style.animation = 'none';
+  }
+
+  if (timeLeft === 0) {
+    clearInterval(timerInterval);
+    isRunning = false;
+    alert('Time is up! 30 minutes have elapsed.');
+  }
+}
+
+function startTimer() {
+  if (!isRunning) {
+    isRunning = true;
+    timerInterval = setInterval(() => {
+      timeLeft--;
+      updateTimerDisplay();
+    }, 1000);
+  }
+}
+
+function pauseTimer() {
+  clearInterval(timerInterval);
+  isRunning = false;
+}
+
+function resetTimer() {
+  clearInterval(timerInterval);
+  isRunning = false;
+  timeLeft = 30 * 60;
+  updateTimerDisplay();
+}
+
+// Sidebar functions
+function showSidebar() {
+  document.getElementById('scoring-sidebar').classList.remove('-translate-x-full');
+  document.getElementById('show-sidebar').classList.add('hidden');
+}
+
+function hideSidebar() {
+  document.getElementById('scoring-sidebar').classList.add('-translate-x-full');
+  document.getElementById('show-sidebar').classList.remove('hidden');
+}
+
+function showTimer() {
+  document.getElementById('timer-sidebar').classList.remove('translate-x-full');
+  document.getElementById('show-timer').classList.add('hidden');
+}
+
+function hideTimer() {
+  document.getElementById('timer-sidebar').classList.add('translate-x-full');
+  document.getElementById('show-timer').classList.remove('hidden');
+}
+
+// Event listeners
+document.getElementById('show-sidebar').addEventListener('click', showSidebar);
+document.getElementById('close-sidebar').addEventListener('click', hideSidebar);
+document.getElementById('show-timer').addEventListener('click', showTimer);
+document.getElementById('close-timer').addEventListener('click', hideTimer);
+
+document.getElementById('start-timer').addEventListener('click', startTimer);
+document.getElementById('pause-timer').addEventListener('click', pauseTimer);
+document.getElementById('reset-timer').addEventListener('click', resetTimer);
+
+// Initialize timer display
+updateTimerDisplay();
+
+// Mode switching functions
+function showGenerateMode() {
+  document.getElementById('generate-mode').classList.remove('hidden');
+  document.getElementById('write-mode').classList.add('hidden');
+  document.getElementById('sample-section').style.display = 'block';
+
+  // Update tab styles
+  document.getElementById('tab-generate').classList.add('border-blue-600', 'text-blue-600', 'font-semibold');
+  document.getElementById('tab-generate').classList.remove('border-transparent', 'text-gray-600');
+  document.getElementById('tab-write').classList.add('border-transparent', 'text-gray-600');
+  document.getElementById('tab-write').classList.remove('border-blue-600', 'text-blue-600', 'font-semibold');
+}
+
+function showWriteMode() {
+  document.getElementById('generate-mode').classList.add('hidden');
+  document.getElementById('write-mode').classList.remove('hidden');
+  document.getElementById('sample-section').style.display = 'none';
+
+  // Update tab styles
+  document.getElementById('tab-write').classList.add('border-blue-600', 'text-blue-600', 'font-semibold');
+  document.getElementById('tab-write').classList.remove('border-transparent', 'text-gray-600');
+  document.getElementById('tab-generate').classList.add('border-transparent', 'text-gray-600');
+  document.getElementById('tab-generate').classList.remove('border-blue-600', 'text-blue-600', 'font-semibold');
+}
+
+// Writing analysis variables
+let currentAnalysis = null;
+let highlightTimeout = null;
+
+// Enhanced word count function
+function updateWordCount() {
+  const text = document.getElementById('user-essay').value;
+  const words = text.trim() === '' ? 0 : text.trim().split(/\s+/).length;
+  const chars = text.length;
+  const sentences = text.trim() === '' ? 0 : text.split(/[.!?]+/).filter(s => s.trim().length > 0).length;
+  const paragraphs = text.trim() === '' ? 0 : text.split(/\n\s*\n/).filter(p => p.trim().length > 0).length;
+
+  document.getElementById('word-count').textContent = `Words: ${words}`;
+  document.getElementById('char-count').textContent = `Characters: ${chars}`;
+  document.getElementById('sentence-count').textContent = `Sentences: ${sentences}`;
+  document.getElementById('paragraph-count').textContent = `Paragraphs: ${paragraphs}`;
+
+  // Auto-check writing after user stops typing for 3 seconds
+  clearTimeout(highlightTimeout);
+  if (words > 10) {
+    highlightTimeout = setTimeout(() => {
+      checkWritingAutomatically();
+    }, 3000);
+  }
+}
+
+// Analysis panel toggle functions
+function showAnalysisPanel() {
+  document.getElementById('analysis-panel').classList.remove('translate-x-full');
+  document.getElementById('toggle-analysis').innerHTML = '📊 Hide Analysis';
+  document.getElementById('toggle-analysis').classList.remove('bg-blue-500', 'hover:bg-blue-600');
+  document.getElementById('toggle-analysis').classList.add('bg-gray-500', 'hover:bg-gray-600');
+}
+
+function hideAnalysisPanel() {
+  document.getElementById('analysis-panel').classList.add('translate-x-full');
+  document.getElementById('toggle-analysis').innerHTML = '📊 Show Analysis';
+  document.getElementById('toggle-analysis').classList.remove('bg-gray-500', 'hover:bg-gray-600');
+  document.getElementById('toggle-analysis').classList.add('bg-blue-500', 'hover:bg-blue-600');
+}
+
+function toggleAnalysisPanel() {
+  const panel = document.getElementById('analysis-panel');
+  if (panel.classList.contains('translate-x-full')) {
+    showAnalysisPanel();
+  } else {
+    hideAnalysisPanel();
+  }
+}
+
+// Feedback tab switching
+function switchFeedbackTab(tabName) {
+  // Update tab styles
+  document.querySelectorAll('.feedback-tab').forEach(tab => {
+    tab.classList.remove('border-red-500', 'text-red-600', 'border-green-500', 'text-green-600', 'border-blue-500', 'text-blue-600', 'border-purple-500', 'text-purple-600', 'border-indigo-500', 'text-indigo-600', 'border-gray-500', 'text-gray-800', 'font-semibold');
+    tab.classList.add('border-transparent', 'text-gray-600');
+  });
+
+  // Hide all panels
+  document.querySelectorAll('.feedback-panel').forEach(panel => {
+    panel.classList.add('hidden');
+  });
+
+  // Show selected tab and panel
+  const selectedTab = document.getElementById(`tab-${tabName}`);
+  const selectedPanel = document.getElementById(`feedback-${tabName}`);
+
+  if (selectedTab && selectedPanel) {
+    selectedPanel.classList.remove('hidden');
+
+    // Set appropriate colors for each tab
+    switch(tabName) {
+      case 'errors':
+        selectedTab.classList.add('border-red-500', 'text-red-600', 'font-semibold');
+        break;
+      case 'strengths':
+        selectedTab.classList.add('border-green-500', 'text-green-600', 'font-semibold');
+        break;
+      case 'vocabulary':
+        selectedTab.classList.add('border-blue-500', 'text-blue-600', 'font-semibold');
+        break;
+      case 'structure':
+        selectedTab.classList.add('border-purple-500', 'text-purple-600', 'font-semibold');
+        break;
+      case 'toefl':
+        selectedTab.classList.add('border-indigo-500', 'text-indigo-600', 'font-semibold');
+        break;
+      case 'overall':
+        selectedTab.classList.add('border-gray-500', 'text-gray-800', 'font-semibold');
+        break;
+    }
+  }
+}
+
+// Automatic writing check (less intrusive)
+async function checkWritingAutomatically() {
+  const text = document.getElementById('user-essay').value.trim();
+  if (text.length < 50) return;
+
+  try {
+    const response = await fetch('/analyze_writing', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ essay: text })
+    });
+
+    const data = await response.json();
+    if (data.analysis) {
+      currentAnalysis = data.analysis;
+      updateFeedbackPanels();
+    }
+  } catch (error) {
+    console.log('Auto-analysis failed:', error);
+  }
+}
+
+// Manual writing check with full highlighting
+async function checkWritingManually() {
+  const text = document.getElementById('user-essay').value.trim();
+  if (!text) {
+    alert('Please write something first!');
+    return;
+  }
+
+  // Show loading
+  document.getElementById('feedback-errors').innerHTML = '<div class="text-blue-600">🔍 Analyzing your writing...</div>';
+
+  try {
+    const response = await fetch('/analyze_writing', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ essay: text })
+    });
+
+    const data = await response.json();
+    if (data.analysis) {
+      currentAnalysis = data.analysis;
+      updateFeedbackPanels();
+      highlightText();
+    }
+  } catch (error) {
+    document.getElementById('feedback-errors').innerHTML = '<div class="text-red-600">Error analyzing writing. Please try again.</div>';
+  }
+}
+
+// Update feedback panels with analysis data - Enhanced version
+function updateFeedbackPanels() {
+  if (!currentAnalysis) return;
+
+  // Update errors panel
+  updateErrorsPanel();
+
+  // Update strengths panel
+  updateStrengthsPanel();
+
+  // Update vocabulary panel
+  updateVocabularyPanel();
+
+  // Update structure panel
+  updateStructurePanel();
+
+  // Update TOEFL tips panel
+  updateTOEFLPanel();
+
+  // Update overall assessment panel
+  updateOverallPanel();
+}
+
+function updateErrorsPanel() {
+  let errorsHTML = '';
+
+  if (currentAnalysis.spelling_errors && currentAnalysis.spelling_errors.length > 0) {
+    errorsHTML += '<div class="mb-4"><h5 class="font-semibold text-red-600 mb-3 flex items-center"><span class="text-lg mr-2">🔤</span>Spelling Errors</h5>';
+    currentAnalysis.spelling_errors.forEach(error => {
+      const severityColor = error.severity === 'high' ? 'red' : error.severity === 'medium' ? 'yellow' : 'orange';
+      errorsHTML += `
+        <div class="mb-3 p-3 bg-${severityColor}-50 border-l-4 border-${severityColor}-400 rounded-r">
+          <div class="font-medium text-${severityColor}-700">"${error.word}"</div>
+          <div class="text-sm text-gray-600 mt-1">💡 Suggestions: ${error.suggestions.join(', ')}</div>
+          ${error.context ? `<div class="text-xs text-gray-500 mt-1 italic">"${error.context}"</div>` : ''}
+        </div>`;
+    });
+    errorsHTML += '</div>';
+  }
+
+  if (currentAnalysis.grammar_issues && currentAnalysis.grammar_issues.length > 0) {
+    errorsHTML += '<div class="mb-4"><h5 class="font-semibold text-red-600 mb-3 flex items-center"><span class="text-lg mr-2">📝</span>Grammar Issues</h5>';
+    currentAnalysis.grammar_issues.forEach(issue => {
+      const severityColor = issue.severity === 'high' ? 'red' : issue.severity === 'medium' ? 'yellow' : 'orange';
+      errorsHTML += `
+        <div class="mb-3 p-3 bg-${severityColor}-50 border-l-4 border-${severityColor}-400 rounded-r">
+          <div class="font-medium text-${severityColor}-700">${issue.issue}</div>
+          <div class="text-sm text-gray-600 mt-1">❌ "${issue.text}" → ✅ "${issue.suggestion}"</div>
+          ${issue.explanation ? `<div class="text-xs text-gray-500 mt-1 italic">${issue.explanation}</div>` : ''}
+        </div>`;
+    });
+    errorsHTML += '</div>';
+  }
+
+  if (currentAnalysis.weaknesses && currentAnalysis.weaknesses.length > 0) {
+    errorsHTML += '<div class="mb-4"><h5 class="font-semibold text-yellow-600 mb-3 flex items-center"><span class="text-lg mr-2">⚠️</span>Areas for Improvement</h5>';
+    currentAnalysis.weaknesses.forEach(weakness => {
+      errorsHTML += `
+        <div class="mb-3 p-3 bg-yellow-50 border-l-4 border-yellow-400 rounded-r">
+          <div class="font-medium text-yellow-700">${weakness.issue}</div>
+          <div class="text-sm text-gray-600 mt-1">"${weakness.text}"</div>
+          <div class="text-sm text-blue-600 mt-1">💡 ${weakness.suggestion}</div>
+        </div>`;
+    });
+    errorsHTML += '</div>';
+  }
+
+  if (!errorsHTML) {
+    errorsHTML = `
+      <div class="text-center py-8 text-green-600">
+        <div class="text-4xl mb-2">✅</div>
+        <div class="font-semibold">Excellent work!</div>
+        <div class="text-sm text-gray-600">No major errors detected.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-errors').innerHTML = errorsHTML;
+}
+
+function updateStrengthsPanel() {
+  let strengthsHTML = '';
+
+  if (currentAnalysis.strengths && currentAnalysis.strengths.length > 0) {
+    strengthsHTML += '<div class="mb-4"><h5 class="font-semibold text-green-600 mb-3 flex items-center"><span class="text-lg mr-2">💪</span>Writing Strengths</h5>';
+    currentAnalysis.strengths.forEach(strength => {
+      strengthsHTML += `
+        <div class="mb-3 p-3 bg-green-50 border-l-4 border-green-400 rounded-r">
+          <div class="font-medium text-green-700">"${strength.text}"</div>
+          <div class="text-sm text-gray-600 mt-1">${strength.reason}</div>
+          <div class="text-xs text-green-600 mt-1 font-medium">Category: ${strength.category}</div>
+        </div>`;
+    });
+    strengthsHTML += '</div>';
+  }
+
+  if (currentAnalysis.sentence_structure && currentAnalysis.sentence_structure.length > 0) {
+    strengthsHTML += '<div class="mb-4"><h5 class="font-semibold text-green-600 mb-3 flex items-center"><span class="text-lg mr-2">🏗️</span>Excellent Sentence Structure</h5>';
+    currentAnalysis.sentence_structure.forEach(structure => {
+      strengthsHTML += `
+        <div class="mb-3 p-3 bg-green-50 border-l-4 border-green-400 rounded-r">
+          <div class="font-medium text-green-700">"${structure.text.length > 60 ? structure.text.substring(0, 60) + '...' : structure.text}"</div>
+          <div class="text-sm text-gray-600 mt-1">${structure.feedback}</div>
+          <div class="text-xs text-green-600 mt-1 font-medium">Type: ${structure.type}</div>
+        </div>`;
+    });
+    strengthsHTML += '</div>';
+  }
+
+  if (currentAnalysis.transitions && currentAnalysis.transitions.length > 0) {
+    strengthsHTML += '<div class="mb-4"><h5 class="font-semibold text-green-600 mb-3 flex items-center"><span class="text-lg mr-2">🔗</span>Effective Transitions</h5>';
+    currentAnalysis.transitions.forEach(transition => {
+      strengthsHTML += `
+        <div class="mb-3 p-3 bg-green-50 border-l-4 border-green-400 rounded-r">
+          <div class="font-medium text-green-700">"${transition.text}"</div>
+          <div class="text-sm text-gray-600 mt-1">${transition.feedback}</div>
+          <div class="text-xs text-green-600 mt-1 font-medium">Function: ${transition.function || transition.type}</div>
+        </div>`;
+    });
+    strengthsHTML += '</div>';
+  }
+
+  if (!strengthsHTML) {
+    strengthsHTML = `
+      <div class="text-center py-8 text-gray-500">
+        <div class="text-4xl mb-2">🌟</div>
+        <div class="font-semibold">Keep writing!</div>
+        <div class="text-sm">Your strengths will appear here as you write more.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-strengths').innerHTML = strengthsHTML;
+}
+
+function updateVocabularyPanel() {
+  let vocabHTML = '';
+
+  if (currentAnalysis.vocabulary_highlights && currentAnalysis.vocabulary_highlights.length > 0) {
+    vocabHTML += '<div class="mb-4"><h5 class="font-semibold text-blue-600 mb-3 flex items-center"><span class="text-lg mr-2">📚</span>Advanced Vocabulary</h5>';
+    currentAnalysis.vocabulary_highlights.forEach(vocab => {
+      const levelColor = vocab.toefl_level === 'high' ? 'blue' : 'indigo';
+      vocabHTML += `
+        <div class="mb-3 p-3 bg-${levelColor}-50 border-l-4 border-${levelColor}-400 rounded-r">
+          <div class="font-medium text-${levelColor}-700">"${vocab.word}"</div>
+          <div class="text-sm text-gray-600 mt-1">${vocab.reason}</div>
+          <div class="text-xs text-${levelColor}-600 mt-1 font-medium">
+            Type: ${vocab.type} | TOEFL Level: ${vocab.toefl_level}
+          </div>
+        </div>`;
+    });
+    vocabHTML += '</div>';
+  }
+
+  // Add general vocabulary suggestions if available
+  if (currentAnalysis.suggestions) {
+    const vocabSuggestions = currentAnalysis.suggestions.filter(s => 
+      s.toLowerCase().includes('vocabulary') || s.toLowerCase().includes('word')
+    );
+    if (vocabSuggestions.length > 0) {
+      vocabHTML += '<div class="mb-4"><h5 class="font-semibold text-blue-600 mb-3 flex items-center"><span class="text-lg mr-2">💡</span>Vocabulary Tips</h5>';
+      vocabSuggestions.forEach(suggestion => {
+        vocabHTML += `
+          <div class="mb-3 p-3 bg-blue-50 border-l-4 border-blue-400 rounded-r">
+            <div class="text-sm text-gray-700">${suggestion}</div>
+          </div>`;
+      });
+      vocabHTML += '</div>';
+    }
+  }
+
+  if (!vocabHTML) {
+    vocabHTML = `
+      <div class="text-center py-8 text-gray-500">
+        <div class="text-4xl mb-2">📚</div>
+        <div class="font-semibold">Vocabulary Analysis</div>
+        <div class="text-sm">Continue writing to see advanced vocabulary usage and suggestions.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-vocabulary').innerHTML = vocabHTML;
+}
+
+function updateStructurePanel() {
+  let structureHTML = '';
+
+  if (currentAnalysis.coherence_analysis && currentAnalysis.coherence_analysis.length > 0) {
+    structureHTML += '<div class="mb-4"><h5 class="font-semibold text-purple-600 mb-3 flex items-center"><span class="text-lg mr-2">🔄</span>Coherence Analysis</h5>';
+    currentAnalysis.coherence_analysis.forEach(coherence => {
+      const severityColor = coherence.severity === 'high' ? 'red' : coherence.severity === 'medium' ? 'yellow' : 'blue';
+      structureHTML += `
+        <div class="mb-3 p-3 bg-${severityColor}-50 border-l-4 border-${severityColor}-400 rounded-r">
+          <div class="font-medium text-${severityColor}-700">${coherence.issue}</div>
+          <div class="text-sm text-gray-600 mt-1">${coherence.suggestion}</div>
+          ${coherence.paragraph ? `<div class="text-xs text-gray-500 mt-1">Paragraph: ${coherence.paragraph}</div>` : ''}
+        </div>`;
+    });
+    structureHTML += '</div>';
+  }
+
+  if (currentAnalysis.development_feedback && currentAnalysis.development_feedback.length > 0) {
+    structureHTML += '<div class="mb-4"><h5 class="font-semibold text-purple-600 mb-3 flex items-center"><span class="text-lg mr-2">📈</span>Development Feedback</h5>';
+    currentAnalysis.development_feedback.forEach(feedback => {
+      structureHTML += `
+        <div class="mb-3 p-3 bg-purple-50 border-l-4 border-purple-400 rounded-r">
+          <div class="font-medium text-purple-700">${feedback.aspect}</div>
+          <div class="text-sm text-gray-600 mt-1">${feedback.comment}</div>
+          <div class="text-sm text-blue-600 mt-1">💡 ${feedback.suggestion}</div>
+        </div>`;
+    });
+    structureHTML += '</div>';
+  }
+
+  // Add structure-related suggestions
+  if (currentAnalysis.suggestions) {
+    const structureSuggestions = currentAnalysis.suggestions.filter(s => 
+      s.toLowerCase().includes('structure') || s.toLowerCase().includes('paragraph') || 
+      s.toLowerCase().includes('organization') || s.toLowerCase().includes('transition')
+    );
+    if (structureSuggestions.length > 0) {
+      structureHTML += '<div class="mb-4"><h5 class="font-semibold text-purple-600 mb-3 flex items-center"><span class="text-lg mr-2">📝</span>Structure Tips</h5>';
+      structureSuggestions.forEach(suggestion => {
+        structureHTML += `
+          <div class="mb-3 p-3 bg-purple-50 border-l-4 border-purple-400 rounded-r">
+            <div class="text-sm text-gray-700">${suggestion}</div>
+          </div>`;
+      });
+      structureHTML += '</div>';
+    }
+  }
+
+  if (!structureHTML) {
+    structureHTML = `
+      <div class="text-center py-8 text-gray-500">
+        <div class="text-4xl mb-2">🏗️</div>
+        <div class="font-semibold">Structure Analysis</div>
+        <div class="text-sm">Write more content to receive detailed feedback on essay structure and organization.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-structure').innerHTML = structureHTML;
+}
+
+function updateTOEFLPanel() {
+  let toeflHTML = '';
+
+  if (currentAnalysis.toefl_specific_tips && currentAnalysis.toefl_specific_tips.length > 0) {
+    // Group tips by category
+    const tipsByCategory = {};
+    currentAnalysis.toefl_specific_tips.forEach(tip => {
+      if (!tipsByCategory[tip.category]) {
+        tipsByCategory[tip.category] = [];
+      }
+      tipsByCategory[tip.category].push(tip);
+    });
+
+    Object.keys(tipsByCategory).forEach(category => {
+      const categoryIcon = {
+        'task_response': '🎯',
+        'organization': '📋',
+        'language_use': '🗣️',
+        'development': '📈',
+        'general': '💡'
+      };
+
+      toeflHTML += `<div class="mb-4"><h5 class="font-semibold text-indigo-600 mb-3 flex items-center"><span class="text-lg mr-2">${categoryIcon[category] || '💡'}</span>${category.replace('_', ' ').toUpperCase()}</h5>`;
+
+      tipsByCategory[category].forEach(tip => {
+        const priorityColor = tip.priority === 'high' ? 'red' : tip.priority === 'medium' ? 'yellow' : 'blue';
+        toeflHTML += `
+          <div class="mb-3 p-3 bg-indigo-50 border-l-4 border-${priorityColor}-400 rounded-r">
+            <div class="text-sm text-gray-700">${tip.tip}</div>
+            <div class="text-xs text-indigo-600 mt-1 font-medium">Priority: ${tip.priority}</div>
+          </div>`;
+      });
+      toeflHTML += '</div>';
+    });
+  }
+
+  // Add general TOEFL suggestions
+  if (currentAnalysis.suggestions) {
+    const toeflSuggestions = currentAnalysis.suggestions.filter(s => 
+      s.toLowerCase().includes('toefl') || s.toLowerCase().includes('score') || 
+      s.toLowerCase().includes('exam') || s.toLowerCase().includes('test')
+    );
+    if (toeflSuggestions.length > 0) {
+      toeflHTML += '<div class="mb-4"><h5 class="font-semibold text-indigo-600 mb-3 flex items-center"><span class="text-lg mr-2">📋</span>General TOEFL Tips</h5>';
+      toeflSuggestions.forEach(suggestion => {
+        toeflHTML += `
+          <div class="mb-3 p-3 bg-indigo-50 border-l-4 border-indigo-400 rounded-r">
+            <div class="text-sm text-gray-700">${suggestion}</div>
+          </div>`;
+      });
+      toeflHTML += '</div>';
+    }
+  }
+
+  if (!toeflHTML) {
+    toeflHTML = `
+      <div class="text-center py-8 text-gray-500">
+        <div class="text-4xl mb-2">🎯</div>
+        <div class="font-semibold">TOEFL-Specific Tips</div>
+        <div class="text-sm">TOEFL writing strategies and tips will appear here based on your essay.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-toefl').innerHTML = toeflHTML;
+}
+
+function updateOverallPanel() {
+  let overallHTML = '';
+
+  if (currentAnalysis.overall_assessment) {
+    const assessment = currentAnalysis.overall_assessment;
+
+    overallHTML += '<div class="space-y-4">';
+
+    // Word count feedback
+    if (assessment.word_count_feedback) {
+      overallHTML += `
+        <div class="p-4 bg-gray-50 rounded-lg">
+          <h6 class="font-semibold text-gray-700 mb-2 flex items-center"><span class="text-lg mr-2">📊</span>Word Count</h6>
+          <div class="text-sm text-gray-600">${assessment.word_count_feedback}</div>
+        </div>`;
+    }
+
+    // Essay structure
+    if (assessment.essay_structure) {
+      overallHTML += `
+        <div class="p-4 bg-gray-50 rounded-lg">
+          <h6 class="font-semibold text-gray-700 mb-2 flex items-center"><span class="text-lg mr-2">🏗️</span>Essay Structure</h6>
+          <div class="text-sm text-gray-600">${assessment.essay_structure}</div>
+        </div>`;
+    }
+
+    // Argument strength
+    if (assessment.argument_strength) {
+      overallHTML += `
+        <div class="p-4 bg-gray-50 rounded-lg">
+          <h6 class="font-semibold text-gray-700 mb-2 flex items-center"><span class="text-lg mr-2">💪</span>Argument Strength</h6>
+          <div class="text-sm text-gray-600">${assessment.argument_strength}</div>
+        </div>`;
+    }
+
+    // Estimated TOEFL band
+    if (assessment.estimated_toefl_band) {
+      overallHTML += `
+        <div class="p-4 bg-blue-50 rounded-lg border-l-4 border-blue-400">
+          <h6 class="font-semibold text-blue-700 mb-2 flex items-center"><span class="text-lg mr-2">🎯</span>Estimated TOEFL Score</h6>
+          <div class="text-sm text-gray-600">${assessment.estimated_toefl_band}</div>
+        </div>`;
+    }
+
+    overallHTML += '</div>';
+  }
+
+  // Add overall suggestions if available
+  if (currentAnalysis.suggestions && currentAnalysis.suggestions.length > 0) {
+    const generalSuggestions = currentAnalysis.suggestions.filter(s => 
+      !s.toLowerCase().includes('vocabulary') && !s.toLowerCase().includes('structure') && 
+      !s.toLowerCase().includes('toefl') && !s.toLowerCase().includes('word')
+    );
+
+    if (generalSuggestions.length > 0) {
+      overallHTML += '<div class="mt-4"><h5 class="font-semibold text-gray-700 mb-3 flex items-center"><span class="text-lg mr-2">💡</span>Key Recommendations</h5>';
+      generalSuggestions.forEach(suggestion => {
+        overallHTML += `
+          <div class="mb-3 p-3 bg-blue-50 border-l-4 border-blue-400 rounded-r">
+            <div class="text-sm text-gray-700">${suggestion}</div>
+          </div>`;
+      });
+      overallHTML += '</div>';
+    }
+  }
+
+  if (!overallHTML) {
+    overallHTML = `
+      <div class="text-center py-8 text-gray-500">
+        <div class="text-4xl mb-2">📊</div>
+        <div class="font-semibold">Overall Assessment</div>
+        <div class="text-sm">A comprehensive summary of your essay will appear here.</div>
+      </div>`;
+  }
+
+  document.getElementById('feedback-overall').innerHTML = overallHTML;
+}
+
+// Highlight text in the writing area with improved precision
+function highlightText() {
+  if (!currentAnalysis) return;
+
+  const textarea = document.getElementById('user-essay');
+  const displayDiv = document.getElementById('writing-display');
+  const text = textarea.value;
+
+  let highlightedText = escapeHtml(text);
+
+  // Create a list of all highlights with priorities
+  const allHighlights = [];
+
+  // Add spelling errors (highest priority - red)
+  if (currentAnalysis.spelling_errors) {
+    currentAnalysis.spelling_errors.forEach(error => {
+      addHighlightToList(allHighlights, error.word, 'spelling-error', 4);
+    });
+  }
+
+  // Add grammar issues (high priority - red underline)
+  if (currentAnalysis.grammar_issues) {
+    currentAnalysis.grammar_issues.forEach(issue => {
+      addHighlightToList(allHighlights, issue.text, 'grammar-error', 3);
+    });
+  }
+
+  // Add weaknesses (medium priority - yellow)
+  if (currentAnalysis.weaknesses) {
+    currentAnalysis.weaknesses.forEach(weakness => {
+      addHighlightToList(allHighlights, weakness.text, 'weakness', 2);
+    });
+  }
+
+  // Add vocabulary highlights (low priority - blue)
+  if (currentAnalysis.vocabulary_highlights) {
+    currentAnalysis.vocabulary_highlights.forEach(vocab => {
+      addHighlightToList(allHighlights, vocab.word, 'vocab-highlight', 1);
+    });
+  }
+
+  // Add strengths (low priority - green)
+  if (currentAnalysis.strengths) {
+    currentAnalysis.strengths.forEach(strength => {
+      addHighlightToList(allHighlights, strength.text, 'strength', 1);
+    });
+  }
+
+  // Sort highlights by priority (highest first) and then by length (longest first)
+  allHighlights.sort((a, b) => {
+    if (a.priority !== b.priority) return b.priority - a.priority;
+    return b.text.length - a.text.length;
+  });
+
+  // Apply highlights
+  allHighlights.forEach(highlight => {
+    const regex = new RegExp(`\\b${escapeRegExp(highlight.text)}\\b`, 'gi');
+    highlightedText = highlightedText.replace(regex, (match) => {
+      return `<span class="${getHighlightClass(highlight.type)}" title="${getHighlightTitle(highlight.type)}">${match}</span>`;
+    });
+  });
+
+  // Replace line breaks for display
+  highlightedText = highlightedText.replace(/\n/g, '<br>');
+
+  displayDiv.innerHTML = highlightedText;
+  displayDiv.style.opacity = '1';
+
+  // Auto-hide highlights after 8 seconds
+  setTimeout(() => {
+    if (displayDiv.style.opacity === '1') {
+      displayDiv.style.opacity = '0.7';
+    }
+  }, 8000);
+}
+
+// Helper function to add highlights to list
+function addHighlightToList(list, text, type, priority) {
+  if (text && text.trim().length > 0) {
+    list.push({
+      text: text.trim(),
+      type: type,
+      priority: priority
+    });
+  }
+}
+
+// Helper function to escape HTML
+function escapeHtml(text) {
+  const div = document.createElement('div');
+  div.textContent = text;
+  return div.innerHTML;
+}
+
+// Helper function to escape regex special characters
+function escapeRegExp(string) {
+  return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+// Helper function to get CSS class for highlight type
+function getHighlightClass(type) {
+  switch (type) {
+    case 'spelling-error':
+      return 'highlight-error';
+    case 'grammar-error':
+      return 'highlight-grammar';
+    case 'weakness':
+      return 'highlight-weakness';
+    case 'vocab-highlight':
+      return 'highlight-vocab';
+    case 'strength':
+      return 'highlight-strength';
+    default:
+      return 'highlight-default';
+  }
+}
+
+// Helper function to get tooltip title for highlight type
+function getHighlightTitle(type) {
+  switch (type) {
+    case 'spelling-error':
+      return 'Spelling Error - Check the errors panel for suggestions';
+    case 'grammar-error':
+      return 'Grammar Issue - Check the errors panel for details';
+    case 'weakness':
+      return 'Area for Improvement - Check the errors panel for suggestions';
+    case 'vocab-highlight':
+      return 'Advanced Vocabulary - Great word choice!';
+    case 'strength':
+      return 'Writing Strength - Excellent work!';
+    default:
+      return 'Highlighted text';
+  }
+}
+
+// Clear highlights with smooth transition
+function clearHighlights() {
+  const displayDiv = document.getElementById('writing-display');
+  displayDiv.style.opacity = '0';
+  setTimeout(() => {
+    displayDiv.innerHTML = '';
+  }, 300);
+}
+
+// Tab switching event listeners
+document.getElementById('tab-generate').addEventListener('click', showGenerateMode);
+document.getElementById('tab-write').addEventListener('click', showWriteMode);
+
+// Writing analysis event listeners
+document.getElementById('user-essay').addEventListener('input', updateWordCount);
+document.getElementById('check-writing').addEventListener('click', checkWritingManually);
+document.getElementById('clear-highlights').addEventListener('click', clearHighlights);
+document.getElementById('toggle-analysis').addEventListener('click', toggleAnalysisPanel);
+document.getElementById('close-analysis').addEventListener('click', hideAnalysisPanel);
+
+// Feedback tab event listeners
+document.getElementById('tab-errors').addEventListener('click', () => switchFeedbackTab('errors'));
+document.getElementById('tab-strengths').addEventListener('click', () => switchFeedbackTab('strengths'));
+document.getElementById('tab-vocabulary').addEventListener('click', () => switchFeedbackTab('vocabulary'));
+document.getElementById('tab-structure').addEventListener('click', () => switchFeedbackTab('structure'));
+document.getElementById('tab-toefl').addEventListener('click', () => switchFeedbackTab('toefl'));
+document.getElementById('tab-overall').addEventListener('click', () => switchFeedbackTab('overall'));
+
+// Initialize feedback tab
+switchFeedbackTab('errors');
+
+// Auto-show analysis panel when checking writing
+const originalCheckWriting = checkWritingManually;
+checkWritingManually = async function() {
+  await originalCheckWriting.call(this);
+  // Show analysis panel after checking
+  if (currentAnalysis) {
+    showAnalysisPanel();
+  }
+};
+
+document.getElementById('generate').addEventListener('click', async () => {
+  const promptSelect = document.getElementById('prompt');
+  currentPrompt = promptSelect.options[promptSelect.selectedIndex].text;
+
+  // Show loading state
+  document.getElementById('sample').innerHTML = '<div style="text-align: center; padding: 40px; color: #6B7280;">🔄 Generating essay... Please wait.</div>';
+
+  const response = await fetch('/generate_sample', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ prompt: currentPrompt }),
+  });
+
+  const data = await response.json();
+  if (data.sample) {
+    currentEssay = data.sample;
+    document.getElementById('sample').innerHTML = data.sample;
+    document.getElementById('score').style.display = 'block';
+  } else {
+    document.getElementById('sample').textContent = 'Error generating sample.';
+  }
+});
+
+document.getElementById('score').addEventListener('click', async () => {
+  if (!currentEssay || !currentPrompt) {
+    alert('Please generate an essay first.');
+    return;
+  }
+
+  // Show scoring section and loading state
+  document.getElementById('scoring-section').style.display = 'block';
+  document.getElementById('scoring').innerHTML = '<div style="text-align: center; padding: 40px; color: #6B7280;">📊 Analyzing and scoring essay... Please wait.</div>';
+
+  // Extract text content from HTML for scoring
+  const tempDiv = document.createElement('div');
+  tempDiv.innerHTML = currentEssay;
+  const essayText = tempDiv.textContent || tempDiv.innerText || '';
+
+  const response = await fetch('/score_essay', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ 
+      essay: essayText,
+      prompt: currentPrompt 
+    }),
+  });
+
+  const data = await response.json();
+  if (data.scoring) {
+    document.getElementById('scoring').innerHTML = data.scoring;
+  } else {
+    document.getElementById('scoring').textContent = 'Error scoring essay.';
+  }
+});
+
+// Score user's own essay
+document.getElementById('score-user-essay').addEventListener('click', async () => {
+  const userEssay = document.getElementById('user-essay').value.trim();
+  const promptSelect = document.getElementById('prompt');
+  currentPrompt = promptSelect.options[promptSelect.selectedIndex].text;
+
+  if (!userEssay) {
+    alert('Please write your essay first.');
+    return;
+  }
+
+  if (userEssay.split(/\s+/).length < 50) {
+    alert('Your essay is too short. Please write at least 50 words.');
+    return;
+  }
+
+  // Show scoring section and loading state
+  document.getElementById('scoring-section').style.display = 'block';
+  document.getElementById('scoring').innerHTML = '<div style="text-align: center; padding: 40px; color: #6B7280;">📊 Analyzing and scoring your essay... Please wait.</div>';
+
+  const response = await fetch('/score_essay', {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ 
+      essay: userEssay,
+      prompt: currentPrompt 
+    }),
+  });
+
+  const data = await response.json();
+  if (data.scoring) {
+    document.getElementById('scoring').innerHTML = data.scoring;
+  } else {
+    document.getElementById('scoring').textContent = 'Error scoring essay.';
+  }
+});
@@ -0,0 +1,159 @@
+// Initialize similar functionality as IELTS but adapted for GRE
+let currentAnalysis = null;
+let highlightTimeout = null;
+let timerInterval = null;
+let timeLeft = 30 * 60; // 30 minutes for GRE
+let isRunning = false;
+
+// Word count functionality
+function updateWordCount() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    const words = text.trim() === '' ? 0 : text.trim().split(/\s+/).length;
+    const paragraphs = text.trim() === '' ? 0 : text.split(/\n\s*\n/).filter(p => p.trim().length > 0).length;
+    const sentences = text.trim() === '' ? 0 : text.split(/[.!?]+/).filter(s => s.trim().length > 0).length;
+
+    document.getElementById('word-count').textContent = words;
+    document.getElementById('paragraph-count').textContent = paragraphs;
+    document.getElementById('sentence-count').textContent = sentences;
+
+    clearTimeout(highlightTimeout);
+    if (words > 10) {
+        highlightTimeout = setTimeout(() => {
+            checkWritingAutomatically();
+        }, 3000);
+    }
+}
+
+// Timer and other functions similar to IELTS...
+function updateTimerDisplay() {
+    const minutes = Math.floor(timeLeft / 60);
+    const seconds = timeLeft % 60;
+    const display = `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+    document.getElementById('timer-display').textContent = display;
+
+    if (timeLeft <= 5 * 60 && timeLeft > 0) {
+        document.getElementById('timer-warning').classList.remove('hidden');
+    } else {
+        document.getElementById('timer-warning').classList.add('hidden');
+    }
+
+    if (timeLeft === 0) {
+        clearInterval(timerInterval);
+        isRunning = false;
+        alert('Time is up! 30 minutes have elapsed.');
+    }
+}
+
+function startTimer() {
+    if (!isRunning) {
+        isRunning = true;
+        timerInterval = setInterval(() => {
+            timeLeft--;
+            updateTimerDisplay();
+        }, 1000);
+    }
+}
+
+function pauseTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+}
+
+function resetTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+    timeLeft = 30 * 60;
+    updateTimerDisplay();
+}
+
+// Panel functions
+function showSidebar() {
+    document.getElementById('scoring-sidebar').classList.remove('-translate-x-full');
+    document.getElementById('show-sidebar').classList.add('hidden');
+}
+
+function hideSidebar() {
+    document.getElementById('scoring-sidebar').classList.add('-translate-x-full');
+    document.getElementById('show-sidebar').classList.remove('hidden');
+}
+
+function showTimer() {
+    document.getElementById('timer-sidebar').classList.remove('translate-x-full');
+    document.getElementById('show-timer').classList.add('hidden');
+}
+
+function hideTimer() {
+    document.getElementById('timer-sidebar').classList.add('translate-x-full');
+    document.getElementById('show-timer').classList.remove('hidden');
+}
+
+function showAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.remove('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Hide Analysis';
+}
+
+function hideAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.add('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Show Analysis';
+}
+
+function toggleAnalysisPanel() {
+    const panel = document.getElementById('analysis-panel');
+    if (panel.classList.contains('translate-x-full')) {
+        showAnalysisPanel();
+    } else {
+        hideAnalysisPanel();
+    }
+}
+
+async function checkWritingAutomatically() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (text.length < 50) return;
+    console.log('Auto-checking GRE writing:', text);
+}
+
+async function checkWritingManually() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (!text.trim()) {
+        alert('Please write something first!');
+        return;
+    }
+
+    document.getElementById('feedback-errors').innerHTML = '<div class="text-blue-600">🔍 Analyzing your writing...</div>';
+    console.log('Manual check:', text);
+    showAnalysisPanel();
+}
+
+// Event listeners
+document.getElementById('user-essay').addEventListener('input', updateWordCount);
+document.getElementById('check-writing').addEventListener('click', checkWritingManually);
+document.getElementById('toggle-analysis').addEventListener('click', toggleAnalysisPanel);
+document.getElementById('close-analysis').addEventListener('click', hideAnalysisPanel);
+
+document.getElementById('show-sidebar').addEventListener('click', showSidebar);
+document.getElementById('close-sidebar').addEventListener('click', hideSidebar);
+document.getElementById('show-timer').addEventListener('click', showTimer);
+document.getElementById('close-timer').addEventListener('click', hideTimer);
+
+document.getElementById('start-timer').addEventListener('click', startTimer);
+document.getElementById('pause-timer').addEventListener('click', pauseTimer);
+document.getElementById('reset-timer').addEventListener('click', resetTimer);
+
+// Tab switching
+document.getElementById('tab-correction').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-stepbystep').classList.remove('active-tab');
+    document.getElementById('tab-stepbystep').classList.add('inactive-tab');
+});
+
+document.getElementById('tab-stepbystep').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-correction').classList.remove('active-tab');
+    document.getElementById('tab-correction').classList.add('inactive-tab');
+});
+
+// Initialize
+updateTimerDisplay();
+updateWordCount();
@@ -0,0 +1,229 @@
+let currentAnalysis = null;
+let highlightTimeout = null;
+let timerInterval = null;
+let timeLeft = 60 * 60; // 60 minutes for IELTS
+let isRunning = false;
+
+// Word count functionality
+function updateWordCount() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    const words = text.trim() === '' ? 0 : text.trim().split(/\s+/).length;
+    const paragraphs = text.trim() === '' ? 0 : text.split(/\n\s*\n/).filter(p => p.trim().length > 0).length;
+
+    document.getElementById('word-count').textContent = words;
+    document.getElementById('paragraph-count').textContent = paragraphs;
+
+    // Auto-check writing after user stops typing for 3 seconds
+    clearTimeout(highlightTimeout);
+    if (words > 10) {
+        highlightTimeout = setTimeout(() => {
+            checkWritingAutomatically();
+        }, 3000);
+    }
+}
+
+// Timer functions
+function updateTimerDisplay() {
+    const minutes = Math.floor(timeLeft / 60);
+    const seconds = timeLeft % 60;
+    const display = `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+    document.getElementById('timer-display').textContent = display;
+
+    // Flash warning when 5 minutes left
+    if (timeLeft <= 5 * 60 && timeLeft > 0) {
+        document.getElementById('timer-warning').classList.remove('hidden');
+        if (timeLeft <= 5 * 60 && timeLeft % 2 === 0) {
+            document.getElementById('timer-display').classList.add('text-red-600');
+            document.getElementById('timer-display').style.animation = 'blink 1s infinite';
+        }
+    } else {
+        document.getElementById('timer-warning').classList.add('hidden');
+        document.getElementById('timer-display').classList.remove('text-red-600');
+        document.getElementById('timer-display').style.animation = 'none';
+    }
+
+    if (timeLeft === 0) {
+        clearInterval(timerInterval);
+        isRunning = false;
+        alert('Time is up! 60 minutes have elapsed.');
+    }
+}
+
+function startTimer() {
+    if (!isRunning) {
+        isRunning = true;
+        timerInterval = setInterval(() => {
+            timeLeft--;
+            updateTimerDisplay();
+        }, 1000);
+    }
+}
+
+function pauseTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+}
+
+function resetTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+    timeLeft = 60 * 60;
+    updateTimerDisplay();
+}
+
+// Sidebar functions
+function showSidebar() {
+    document.getElementById('scoring-sidebar').classList.remove('-translate-x-full');
+    document.getElementById('show-sidebar').classList.add('hidden');
+}
+
+function hideSidebar() {
+    document.getElementById('scoring-sidebar').classList.add('-translate-x-full');
+    document.getElementById('show-sidebar').classList.remove('hidden');
+}
+
+function showTimer() {
+    document.getElementById('timer-sidebar').classList.remove('translate-x-full');
+    document.getElementById('show-timer').classList.add('hidden');
+}
+
+function hideTimer() {
+    document.getElementById('timer-sidebar').classList.add('translate-x-full');
+    document.getElementById('show-timer').classList.remove('hidden');
+}
+
+// Analysis panel functions
+function showAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.remove('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Hide Analysis';
+    document.getElementById('toggle-analysis').classList.remove('bg-blue-500', 'hover:bg-blue-600');
+    document.getElementById('toggle-analysis').classList.add('bg-gray-500', 'hover:bg-gray-600');
+}
+
+function hideAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.add('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Show Analysis';
+    document.getElementById('toggle-analysis').classList.remove('bg-gray-500', 'hover:bg-gray-600');
+    document.getElementById('toggle-analysis').classList.add('bg-blue-500', 'hover:bg-blue-600');
+}
+
+function toggleAnalysisPanel() {
+    const panel = document.getElementById('analysis-panel');
+    if (panel.classList.contains('translate-x-full')) {
+        showAnalysisPanel();
+    } else {
+        hideAnalysisPanel();
+    }
+}
+
+// Writing analysis functions (simplified for demo)
+async function checkWritingAutomatically() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (text.length < 50) return;
+
+    // This would connect to your backend
+    console.log('Auto-checking writing:', text);
+}
+
+async function checkWritingManually() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (!text.trim()) {
+        alert('Please write something first!');
+        return;
+    }
+
+    // Show loading
+    document.getElementById('feedback-errors').innerHTML = '<div class="text-blue-600">🔍 Analyzing your writing...</div>';
+
+    // This would connect to your backend
+    console.log('Manual check:', text);
+    showAnalysisPanel();
+}
+
+// Event listeners
+document.getElementById('user-essay').addEventListener('input', updateWordCount);
+document.getElementById('check-writing').addEventListener('click', checkWritingManually);
+document.getElementById('toggle-analysis').addEventListener('click', toggleAnalysisPanel);
+document.getElementById('close-analysis').addEventListener('click', hideAnalysisPanel);
+
+// Sidebar event listeners
+document.getElementById('show-sidebar').addEventListener('click', showSidebar);
+document.getElementById('close-sidebar').addEventListener('click', hideSidebar);
+document.getElementById('show-timer').addEventListener('click', showTimer);
+document.getElementById('close-timer').addEventListener('click', hideTimer);
+
+document.getElementById('start-timer').addEventListener('click', startTimer);
+document.getElementById('pause-timer').addEventListener('click', pauseTimer);
+document.getElementById('reset-timer').addEventListener('click', resetTimer);
+
+// Tab switching for main tabs
+document.getElementById('tab-correction').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-stepbystep').classList.remove('active-tab');
+    document.getElementById('tab-stepbystep').classList.add('inactive-tab');
+});
+
+document.getElementById('tab-stepbystep').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-correction').classList.remove('active-tab');
+    document.getElementById('tab-correction').classList.add('inactive-tab');
+});
+
+// Feedback tab switching
+function switchFeedbackTab(tabName) {
+    // Update tab styles
+    document.querySelectorAll('.feedback-tab').forEach(tab => {
+        tab.classList.remove('border-red-500', 'text-red-600', 'border-green-500', 'text-green-600', 'border-blue-500', 'text-blue-600', 'border-purple-500', 'text-purple-600', 'border-indigo-500', 'text-indigo-600', 'border-gray-500', 'text-gray-800', 'font-semibold');
+        tab.classList.add('border-transparent', 'text-gray-600');
+    });
+
+    // Hide all panels
+    document.querySelectorAll('.feedback-panel').forEach(panel => {
+        panel.classList.add('hidden');
+    });
+
+    // Show selected tab and panel
+    const selectedTab = document.getElementById(`tab-${tabName}`);
+    const selectedPanel = document.getElementById(`feedback-${tabName}`);
+
+    if (selectedTab && selectedPanel) {
+        selectedPanel.classList.remove('hidden');
+
+        // Set appropriate colors for each tab
+        switch(tabName) {
+            case 'errors':
+                selectedTab.classList.add('border-red-500', 'text-red-600', 'font-semibold');
+                break;
+            case 'strengths':
+                selectedTab.classList.add('border-green-500', 'text-green-600', 'font-semibold');
+                break;
+            case 'vocabulary':
+                selectedTab.classList.add('border-blue-500', 'text-blue-600', 'font-semibold');
+                break;
+            case 'structure':
+                selectedTab.classList.add('border-purple-500', 'text-purple-600', 'font-semibold');
+                break;
+            case 'ielts':
+                selectedTab.classList.add('border-indigo-500', 'text-indigo-600', 'font-semibold');
+                break;
+            case 'overall':
+                selectedTab.classList.add('border-gray-500', 'text-gray-800', 'font-semibold');
+                break;
+        }
+    }
+}
+
+// Feedback tab event listeners
+document.getElementById('tab-errors').addEventListener('click', () => switchFeedbackTab('errors'));
+document.getElementById('tab-strengths').addEventListener('click', () => switchFeedbackTab('strengths'));
+document.getElementById('tab-vocabulary').addEventListener('click', () => switchFeedbackTab('vocabulary'));
+document.getElementById('tab-structure').addEventListener('click', () => switchFeedbackTab('structure'));
+document.getElementById('tab-ielts').addEventListener('click', () => switchFeedbackTab('ielts'));
+document.getElementById('tab-overall').addEventListener('click', () => switchFeedbackTab('overall'));
+
+// Initialize
+updateTimerDisplay();
+updateWordCount();
+switchFeedbackTab('errors');
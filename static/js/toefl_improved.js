@@ -0,0 +1,370 @@
+// Similar functionality to GRE but adapted for TOEFL
+let currentAnalysis = null;
+let highlightTimeout = null;
+let timerInterval = null;
+let timeLeft = 30 * 60; // 30 minutes for TOEFL
+let isRunning = false;
+
+function updateWordCount() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    const words = text.trim() === '' ? 0 : text.trim().split(/\s+/).length;
+    const paragraphs = text.trim() === '' ? 0 : text.split(/\n\s*\n/).filter(p => p.trim().length > 0).length;
+    const sentences = text.trim() === '' ? 0 : text.split(/[.!?]+/).filter(s => s.trim().length > 0).length;
+
+    document.getElementById('word-count').textContent = words;
+    document.getElementById('paragraph-count').textContent = paragraphs;
+    document.getElementById('sentence-count').textContent = sentences;
+
+    clearTimeout(highlightTimeout);
+    if (words > 10) {
+        highlightTimeout = setTimeout(() => {
+            checkWritingAutomatically();
+        }, 3000);
+    }
+}
+
+// Timer functions
+function updateTimerDisplay() {
+    const minutes = Math.floor(timeLeft / 60);
+    const seconds = timeLeft % 60;
+    const display = `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+    document.getElementById('timer-display').textContent = display;
+
+    if (timeLeft <= 5 * 60 && timeLeft > 0) {
+        document.getElementById('timer-warning').classList.remove('hidden');
+    } else {
+        document.getElementById('timer-warning').classList.add('hidden');
+    }
+
+    if (timeLeft === 0) {
+        clearInterval(timerInterval);
+        isRunning = false;
+        alert('Time is up! 30 minutes have elapsed.');
+    }
+}
+
+function startTimer() {
+    if (!isRunning) {
+        isRunning = true;
+        timerInterval = setInterval(() => {
+            timeLeft--;
+            updateTimerDisplay();
+        }, 1000);
+    }
+}
+
+function pauseTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+}
+
+function resetTimer() {
+    clearInterval(timerInterval);
+    isRunning = false;
+    timeLeft = 30 * 60;
+    updateTimerDisplay();
+}
+
+// Panel functions (similar to previous versions)
+function showSidebar() {
+    document.getElementById('scoring-sidebar').classList.remove('-translate-x-full');
+    document.getElementById('show-sidebar').classList.add('hidden');
+}
+
+function hideSidebar() {
+    document.getElementById('scoring-sidebar').classList.add('-translate-x-full');
+    document.getElementById('show-sidebar').classList.remove('hidden');
+}
+
+function showTimer() {
+    document.getElementById('timer-sidebar').classList.remove('translate-x-full');
+    document.getElementById('show-timer').classList.add('hidden');
+}
+
+function hideTimer() {
+    document.getElementById('timer-sidebar').classList.add('translate-x-full');
+    document.getElementById('show-timer').classList.remove('hidden');
+}
+
+function showAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.remove('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Hide Analysis';
+}
+
+function hideAnalysisPanel() {
+    document.getElementById('analysis-panel').classList.add('translate-x-full');
+    document.getElementById('toggle-analysis').innerHTML = '📊 Show Analysis';
+}
+
+function toggleAnalysisPanel() {
+    const panel = document.getElementById('analysis-panel');
+    if (panel.classList.contains('translate-x-full')) {
+        showAnalysisPanel();
+    } else {
+        hideAnalysisPanel();
+    }
+}
+
+async function checkWritingAutomatically() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (text.length < 50) return;
+    console.log('Auto-checking TOEFL writing:', text);
+}
+
+async function checkWritingManually() {
+    const text = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    if (!text.trim()) {
+        alert('Please write something first!');
+        return;
+    }
+
+    document.getElementById('feedback-errors').innerHTML = '<div class="text-blue-600">🔍 Analyzing your writing...</div>';
+    console.log('Manual check:', text);
+    showAnalysisPanel();
+}
+
+// AI Generation and Scoring variables
+let currentEssay = '';
+let currentPrompt = '';
+
+// AI生成范文功能（新的合并版本）
+async function generateSample() {
+    const promptSelect = document.getElementById('prompt');
+    currentPrompt = promptSelect.options[promptSelect.selectedIndex].text;
+
+    // 显示加载状态
+    document.getElementById('generate-sample-toolbar').innerHTML = '<span class="text-sm font-normal font-[\'PingFang SC\']">🔄 正在生成...</span>';
+    document.getElementById('generate-sample-toolbar').disabled = true;
+
+    try {
+        const response = await fetch('/generate_sample', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ prompt: currentPrompt }),
+        });
+
+        const data = await response.json();
+        if (data.sample) {
+            currentEssay = data.sample;
+
+            // 恢复按钮状态
+            document.getElementById('generate-sample-toolbar').innerHTML = '<span class="text-sm font-normal font-[\'PingFang SC\']">🤖 AI生成范文</span>';
+            document.getElementById('generate-sample-toolbar').disabled = false;
+
+            // 显示操作按钮
+            document.getElementById('insert-sample').style.display = 'block';
+            document.getElementById('reference-sample').style.display = 'block';
+
+            // 存储生成的范文内容
+            document.getElementById('sample-content').innerHTML = `<div class="prose max-w-none font-['PingFang SC'] leading-relaxed text-gray-800">${data.sample}</div>`;
+
+            // 显示成功提示
+            showToast('🎉 AI范文生成成功！您可以选择插入到写作区或查看参考。', 'success');
+
+        } else {
+            document.getElementById('generate-sample-toolbar').innerHTML = '<span class="text-sm font-normal font-[\'PingFang SC\']">🤖 AI生成范文</span>';
+            document.getElementById('generate-sample-toolbar').disabled = false;
+            showToast('❌ 生成范文失败，请重试', 'error');
+        }
+    } catch (error) {
+        document.getElementById('generate-sample-toolbar').innerHTML = '<span class="text-sm font-normal font-[\'PingFang SC\']">🤖 AI生成范文</span>';
+        document.getElementById('generate-sample-toolbar').disabled = false;
+        showToast('❌ 网络错误，请检查连接后重试', 'error');
+    }
+}
+
+// 插入范文到写作区
+function insertSampleToEditor() {
+    if (!currentEssay) {
+        showToast('❌ 没有可插入的范文内容', 'error');
+        return;
+    }
+
+    const userEssay = document.getElementById('user-essay');
+    const currentContent = userEssay.textContent || userEssay.innerText;
+
+    if (currentContent.trim() !== '' && currentContent.trim() !== '请输入TOEFL写作内容（建议300-400个词）') {
+        if (confirm('当前写作区有内容，是否要替换为AI生成的范文？\n\n点击"确定"替换当前内容\n点击"取消"添加到末尾')) {
+            // 替换内容
+            userEssay.innerHTML = `<div>${currentEssay}</div>`;
+        } else {
+            // 添加到末尾
+            userEssay.innerHTML += `<div><br><hr><br><strong>AI生成范文参考：</strong><br>${currentEssay}</div>`;
+        }
+    } else {
+        // 写作区为空，直接插入
+        userEssay.innerHTML = `<div>${currentEssay}</div>`;
+    }
+
+    updateWordCount();
+    showToast('✅ 范文已插入到写作区', 'success');
+}
+
+// 显示范文参考模态框
+function showSampleModal() {
+    if (!currentEssay) {
+        showToast('❌ 没有可查看的范文内容', 'error');
+        return;
+    }
+
+    document.getElementById('sample-modal').style.display = 'flex';
+}
+
+// 关闭范文参考模态框
+function closeSampleModal() {
+    document.getElementById('sample-modal').style.display = 'none';
+}
+
+// 复制范文到剪贴板
+async function copySampleToClipboard() {
+    if (!currentEssay) {
+        showToast('❌ 没有可复制的范文内容', 'error');
+        return;
+    }
+
+    try {
+        // 提取纯文本内容
+        const tempDiv = document.createElement('div');
+        tempDiv.innerHTML = currentEssay;
+        const textContent = tempDiv.textContent || tempDiv.innerText || '';
+
+        await navigator.clipboard.writeText(textContent);
+        showToast('📋 范文已复制到剪贴板', 'success');
+    } catch (error) {
+        showToast('❌ 复制失败，请手动选择复制', 'error');
+    }
+}
+
+// 显示提示消息
+function showToast(message, type = 'info') {
+    const toast = document.createElement('div');
+    toast.className = `fixed top-4 right-4 px-6 py-3 rounded-lg text-white font-['PingFang SC'] z-50 ${
+        type === 'success' ? 'bg-green-500' : 
+        type === 'error' ? 'bg-red-500' : 
+        'bg-blue-500'
+    }`;
+    toast.textContent = message;
+
+    document.body.appendChild(toast);
+
+    setTimeout(() => {
+        toast.remove();
+    }, 3000);
+}
+
+// AI评分功能（统一评分接口）
+async function scoreEssay() {
+    const userEssay = document.getElementById('user-essay').textContent || document.getElementById('user-essay').innerText;
+    const promptSelect = document.getElementById('prompt');
+    currentPrompt = promptSelect.options[promptSelect.selectedIndex].text;
+
+    if (!userEssay || userEssay.trim().length === 0 || userEssay.trim() === '请输入TOEFL写作内容（建议300-400个词）') {
+        alert('请先写作文');
+        return;
+    }
+
+    if (userEssay.split(/\s+/).length < 30) {
+        alert('作文太短，请至少写30个单词');
+        return;
+    }
+
+    // 显示评分区域和加载状态
+    document.getElementById('scoring-section').style.display = 'block';
+    document.getElementById('scoring').innerHTML = '<div style="text-align: center; padding: 40px; color: #6B7280;"><div class="text-4xl mb-2">🎯</div><p class="text-lg font-medium">正在AI分析评分...</p><p class="text-sm mt-2">请稍候...</p></div>';
+
+    try {
+        const response = await fetch('/score_essay', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ 
+                essay: userEssay.trim(),
+                prompt: currentPrompt 
+            }),
+        });
+
+        const data = await response.json();
+        if (data.scoring) {
+            document.getElementById('scoring').innerHTML = `<div class="prose max-w-none font-['PingFang SC'] leading-relaxed text-gray-800">${data.scoring}</div>`;
+        } else {
+            document.getElementById('scoring').innerHTML = '<div class="text-center py-8 text-red-500"><div class="text-4xl mb-2">❌</div><p>评分失败，请重试</p></div>';
+        }
+    } catch (error) {
+        document.getElementById('scoring').innerHTML = '<div class="text-center py-8 text-red-500"><div class="text-4xl mb-2">❌</div><p>网络错误，请检查连接后重试</p></div>';
+    }
+}
+
+// 清空作文功能
+function clearEssay() {
+    const userEssay = document.getElementById('user-essay');
+    userEssay.innerHTML = '<p>请输入TOEFL写作内容（建议300-400个词）</p>';
+    updateWordCount();
+
+    // 隐藏分析和评分区域
+    document.getElementById('scoring-section').style.display = 'none';
+    hideAnalysisPanel();
+
+    // 重置AI生成相关的状态
+    currentEssay = '';
+    document.getElementById('insert-sample').style.display = 'none';
+    document.getElementById('reference-sample').style.display = 'none';
+    closeSampleModal();
+
+    showToast('🗑️ 写作内容已清空', 'info');
+}
+
+// Event listeners
+document.getElementById('user-essay').addEventListener('input', updateWordCount);
+document.getElementById('toggle-analysis').addEventListener('click', toggleAnalysisPanel);
+document.getElementById('ai-score-btn').addEventListener('click', scoreEssay);
+document.getElementById('clear-essay').addEventListener('click', clearEssay);
+
+// 新的合并功能事件监听器
+document.getElementById('generate-sample-toolbar').addEventListener('click', generateSample);
+document.getElementById('insert-sample').addEventListener('click', insertSampleToEditor);
+document.getElementById('reference-sample').addEventListener('click', showSampleModal);
+document.getElementById('close-sample-modal').addEventListener('click', closeSampleModal);
+document.getElementById('copy-sample').addEventListener('click', copySampleToClipboard);
+document.getElementById('insert-sample-modal').addEventListener('click', () => {
+    insertSampleToEditor();
+    closeSampleModal();
+});
+
+// 点击模态框背景关闭
+document.getElementById('sample-modal').addEventListener('click', (e) => {
+    if (e.target.id === 'sample-modal') {
+        closeSampleModal();
+    }
+});
+document.getElementById('close-analysis').addEventListener('click', hideAnalysisPanel);
+
+document.getElementById('show-sidebar').addEventListener('click', showSidebar);
+document.getElementById('close-sidebar').addEventListener('click', hideSidebar);
+document.getElementById('show-timer').addEventListener('click', showTimer);
+document.getElementById('close-timer').addEventListener('click', hideTimer);
+
+document.getElementById('start-timer').addEventListener('click', startTimer);
+document.getElementById('pause-timer').addEventListener('click', pauseTimer);
+document.getElementById('reset-timer').addEventListener('click', resetTimer);
+
+// Tab switching
+document.getElementById('tab-correction').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-stepbystep').classList.remove('active-tab');
+    document.getElementById('tab-stepbystep').classList.add('inactive-tab');
+});
+
+document.getElementById('tab-stepbystep').addEventListener('click', function() {
+    this.classList.remove('inactive-tab');
+    this.classList.add('active-tab');
+    document.getElementById('tab-correction').classList.remove('active-tab');
+    document.getElementById('tab-correction').classList.add('inactive-tab');
+});
+
+// Initialize
+updateTimerDisplay();
+updateWordCount();
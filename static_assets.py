@@ -0,0 +1,187 @@
+"""Static asset pipeline.
+
+CSS and JS bundles under ``static/css`` and ``static/js`` are fingerprinted
+with a content hash and pre-compressed (gzip, plus brotli when the optional
+``brotli`` package is installed) when the app starts. Templates reference
+them with ``asset_url('js/exam.js')``, which resolves to
+``/assets/js/exam.<hash>.js``. Those URLs are served from memory with a
+one-year immutable Cache-Control, so repeat visits never re-download them.
+
+Rendered pages are cached per template and served compressed with an ETag,
+so repeat visits revalidate with a 304 instead of re-downloading the HTML.
+
+Run ``python static_assets.py`` to print first and repeat page-load bytes
+for every page, before and after bundling.
+"""
+import gzip
+import hashlib
+import os
+import re
+
+from flask import Response, current_app, render_template, request, url_for
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSET_DIRS = {"css": "text/css", "js": "application/javascript"}
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PAGE_CACHE_CONTROL = "no-cache"
+
+
+class Asset:
+    """A response body with its pre-compressed variants and ETag"""
+
+    def __init__(self, data, mimetype):
+        self.mimetype = mimetype
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.variants = {"identity": data}
+        compressed = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(data, quality=11)
+        for encoding, body in compressed.items():
+            # Only keep encodings that actually save bytes
+            if len(body) < len(data):
+                self.variants[encoding] = body
+
+    def negotiate(self):
+        """Pick the best encoding the client accepts, preferring brotli"""
+        offered = [e for e in ("br", "gzip") if e in self.variants] + ["identity"]
+        return request.accept_encodings.best_match(offered, default="identity")
+
+    def send(self, cache_control):
+        encoding = self.negotiate()
+        etag = f"{self.digest[:16]}-{encoding}"
+        headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304, headers=headers)
+        else:
+            response = Response(self.variants[encoding], mimetype=self.mimetype, headers=headers)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+        return response
+
+
+class AssetPipeline:
+    """Fingerprinted bundles and a per-template page cache for one app"""
+
+    def __init__(self, app):
+        self.app = app
+        self.static_dir = os.path.join(app.root_path, "static")
+        self.manifest = {}  # logical name -> fingerprinted name
+        self.assets = {}    # fingerprinted name -> Asset
+        self.mtimes = {}    # logical name -> source mtime
+        self.pages = {}     # template name -> (cache key, Asset)
+        self.build()
+
+    def build(self):
+        """Fingerprint and compress any bundle whose source changed"""
+        for folder, mimetype in ASSET_DIRS.items():
+            folder_path = os.path.join(self.static_dir, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for filename in sorted(os.listdir(folder_path)):
+                path = os.path.join(folder_path, filename)
+                name = f"{folder}/{filename}"
+                mtime = os.path.getmtime(path)
+                if self.mtimes.get(name) == mtime:
+                    continue
+
+                with open(path, "rb") as f:
+                    asset = Asset(f.read(), mimetype)
+                stem, ext = os.path.splitext(filename)
+                hashed = f"{folder}/{stem}.{asset.digest[:10]}{ext}"
+
+                self.assets.pop(self.manifest.get(name), None)
+                self.manifest[name] = hashed
+                self.assets[hashed] = asset
+                self.mtimes[name] = mtime
+
+    def asset_url(self, name):
+        if self.app.debug:
+            self.build()
+        return url_for("assets", filename=self.manifest[name])
+
+    def serve(self, filename):
+        asset = self.assets.get(filename)
+        if asset is None:
+            return Response("Not found", status=404)
+        return asset.send(ASSET_CACHE_CONTROL)
+
+    def render_page(self, template_name):
+        """Render a template once and serve the cached result until it changes"""
+        path = os.path.join(self.app.root_path, self.app.template_folder, template_name)
+        if self.app.debug:
+            self.build()
+        # Pages embed fingerprinted URLs, so a rebuilt bundle invalidates them too
+        key = (os.path.getmtime(path), tuple(sorted(self.manifest.items())))
+
+        cached = self.pages.get(template_name)
+        if cached is None or cached[0] != key:
+            html = render_template(template_name)
+            cached = (key, Asset(html.encode("utf-8"), "text/html"))
+            self.pages[template_name] = cached
+        return cached[1].send(PAGE_CACHE_CONTROL)
+
+
+def init_assets(app):
+    """Build the bundles and register ``asset_url`` and the ``/assets`` route"""
+    pipeline = AssetPipeline(app)
+    app.extensions["static_assets"] = pipeline
+    app.jinja_env.globals["asset_url"] = pipeline.asset_url
+    app.add_url_rule("/assets/<path:filename>", "assets", pipeline.serve)
+    return pipeline
+
+
+def render_page(template_name):
+    """Serve a rendered template from the current app's page cache"""
+    return current_app.extensions["static_assets"].render_page(template_name)
+
+
+def page_load_report(app):
+    """Measure first and repeat page-load bytes for every page route
+
+    "Before" is the page as it used to be served: uncompressed HTML with the
+    bundles inlined, re-downloaded in full on every visit. "After" fetches
+    the page and its bundles over the test client with compression enabled;
+    a repeat visit revalidates the HTML by ETag and reuses the bundles from
+    the browser cache.
+    """
+    client = app.test_client()
+    accept = {"Accept-Encoding": "br, gzip"}
+    rows = []
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint in ("static", "assets") or rule.arguments or "GET" not in rule.methods:
+            continue
+
+        page = client.get(rule.rule, headers=accept)
+        if page.status_code != 200 or page.mimetype != "text/html":
+            continue
+        html = page.get_data()
+        if page.headers.get("Content-Encoding") == "br":
+            html = brotli.decompress(html)
+        elif page.headers.get("Content-Encoding") == "gzip":
+            html = gzip.decompress(html)
+
+        bundle_urls = re.findall(rb'(?:src|href)="(/assets/[^"]+)"', html)
+        bundles = [client.get(url.decode(), headers=accept) for url in bundle_urls]
+        raw = [client.get(url.decode(), headers={"Accept-Encoding": "identity"}) for url in bundle_urls]
+        before = len(html) + sum(len(b.get_data()) for b in raw)
+
+        first = len(page.get_data()) + sum(len(b.get_data()) for b in bundles)
+        repeat = client.get(rule.rule, headers={**accept, "If-None-Match": page.headers["ETag"]})
+        rows.append((rule.rule, before, before, first, len(repeat.get_data())))
+    return rows
+
+
+if __name__ == "__main__":
+    from app import app
+
+    rows = page_load_report(app)
+    print(f"{'page':<18}{'before first':>14}{'before repeat':>15}{'after first':>13}{'after repeat':>14}")
+    for path, before_first, before_repeat, first, repeat in sorted(rows):
+        print(f"{path:<18}{before_first:>14,}{before_repeat:>15,}{first:>13,}{repeat:>14,}")
+    print(f"brotli: {'enabled' if brotli is not None else 'not installed (gzip only)'}")